@@ -2,6 +2,9 @@ from celery import Celery
 
 from .config import settings
 from .database import SessionLocal
+from .services.archive import run_archival
+from .services.assets import run_asset_storage
+from .services.covers import run_cover_rendering
 from .services.pipeline import run_enrichment_and_generation, run_ingestion
 
 celery = Celery('worker', broker=settings.redis_url, backend=settings.redis_url)
@@ -9,7 +12,19 @@ celery.conf.beat_schedule = {
     'ingest-every-5-min': {
         'task': 'app.celery_app.ingest_and_generate',
         'schedule': 300.0,
-    }
+    },
+    'store-assets-every-5-min': {
+        'task': 'app.celery_app.store_assets',
+        'schedule': 300.0,
+    },
+    'render-covers-every-5-min': {
+        'task': 'app.celery_app.render_covers',
+        'schedule': 300.0,
+    },
+    'archive-packs-daily': {
+        'task': 'app.celery_app.archive_packs',
+        'schedule': 86400.0,
+    },
 }
 
 
@@ -18,6 +33,33 @@ def ingest_and_generate():
     db = SessionLocal()
     try:
         run_ingestion(db)
-        run_enrichment_and_generation(db)
+        return run_enrichment_and_generation(db)
+    finally:
+        db.close()
+
+
+@celery.task(name='app.celery_app.store_assets')
+def store_assets():
+    db = SessionLocal()
+    try:
+        return run_asset_storage(db)
+    finally:
+        db.close()
+
+
+@celery.task(name='app.celery_app.render_covers')
+def render_covers():
+    db = SessionLocal()
+    try:
+        return run_cover_rendering(db)
+    finally:
+        db.close()
+
+
+@celery.task(name='app.celery_app.archive_packs')
+def archive_packs():
+    db = SessionLocal()
+    try:
+        return run_archival(db)
     finally:
         db.close()
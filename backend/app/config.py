@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -10,6 +12,26 @@ class Settings(BaseSettings):
     jwt_secret: str = 'dev-secret-change-me'
     jwt_algorithm: str = 'HS256'
     access_token_minutes: int = 60 * 12
+    storage_backend: str = 's3'
+    local_storage_root: str = './storage'
+    s3_endpoint_url: str | None = 'http://minio:9000'
+    s3_access_key: str = 'minio'
+    s3_secret_key: str = 'miniopassword'
+    s3_bucket: str = 'get-sendy-assets'
+    s3_max_pool_connections: int = 20
+    s3_multipart_chunk_mb: int = 8
+    s3_upload_concurrency: int = 4
+    asset_fetch_workers: int = 4
+    asset_spool_max_mb: int = 16
+    cover_font_path: str | None = None
+    cover_format: str = 'png'
+    cover_render_processes: int = 2
+    generator_timeout_seconds: float = 30.0
+    generator_max_concurrency: int = 4
+    generator_max_attempts: int = 3
+    taxonomy_path: str | None = None
+    taxonomy_cache_dir: str | None = str(Path(__file__).resolve().parent / '.cache' / 'taxonomy')
+    archive_after_days: int = 30
 
 
 settings = Settings()
@@ -8,7 +8,9 @@ from .auth import create_access_token, get_current_user, hash_password, verify_p
 from .database import Base, engine, get_db
 from .models import ContentPack, ContentPackStatus, Role, User
 from .schemas import ContentPackOut, ContentPackUpdate, LoginIn, RejectIn, TokenOut, UserCreate, UserOut
-from .services.pipeline import run_enrichment_and_generation, run_ingestion, set_status
+from .serializers import serialize_pack
+from .services.archive import load_archived_pack
+from .services.pipeline import generator_latency_percentiles, run_enrichment_and_generation, run_ingestion, set_status
 
 app = FastAPI(title='Get Sendy Pipeline API')
 
@@ -51,42 +53,6 @@ def login(payload: LoginIn, db: Session = Depends(get_db)):
     return TokenOut(access_token=create_access_token(user.email))
 
 
-def serialize_pack(pack: ContentPack) -> dict:
-    return {
-        'id': pack.id,
-        'source_id': pack.source_id,
-        'title': pack.title,
-        'summary': pack.summary,
-        'bullets': json.loads(pack.bullets),
-        'tags': json.loads(pack.tags),
-        'why_tagged': json.loads(pack.why_tagged),
-        'location_name': pack.location_name,
-        'latitude': pack.latitude,
-        'longitude': pack.longitude,
-        'weather_context': json.loads(pack.weather_context),
-        'weather_coverage_notes': pack.weather_coverage_notes,
-        'breaking': pack.breaking,
-        'distance_km': pack.distance_km,
-        'status': pack.status,
-        'reviewer_notes': pack.reviewer_notes,
-        'created_at': pack.created_at,
-        'drafts': [
-            {
-                'id': d.id,
-                'generator_name': d.generator_name,
-                'headline_options': json.loads(d.headline_options),
-                'cover_spec': json.loads(d.cover_spec),
-                'caption_short': d.caption_short,
-                'caption_long': d.caption_long,
-                'carousel_outline': json.loads(d.carousel_outline),
-            }
-            for d in pack.drafts
-        ],
-        'assets': pack.assets,
-        'attribution': pack.attribution,
-    }
-
-
 @app.get('/content-packs', response_model=list[ContentPackOut])
 def list_content_packs(
     status: ContentPackStatus | None = None,
@@ -103,12 +69,19 @@ def list_content_packs(
     return [serialize_pack(p) for p in packs]
 
 
-@app.get('/content-packs/{pack_id}', response_model=ContentPackOut)
-def get_content_pack(pack_id: int, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
+def load_pack_or_archive(db: Session, pack_id: int) -> dict:
     pack = db.query(ContentPack).filter(ContentPack.id == pack_id).first()
-    if not pack:
+    if pack:
+        return serialize_pack(pack)
+    archived = load_archived_pack(db, pack_id)
+    if archived is None:
         raise HTTPException(status_code=404, detail='Not found')
-    return serialize_pack(pack)
+    return archived
+
+
+@app.get('/content-packs/{pack_id}', response_model=ContentPackOut)
+def get_content_pack(pack_id: int, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
+    return load_pack_or_archive(db, pack_id)
 
 
 @app.patch('/content-packs/{pack_id}', response_model=ContentPackOut)
@@ -165,16 +138,18 @@ def reject_content_pack(pack_id: int, payload: RejectIn, db: Session = Depends(g
 
 @app.get('/content-packs/{pack_id}/export')
 def export_handoff(pack_id: int, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    pack = db.query(ContentPack).filter(ContentPack.id == pack_id).first()
-    if not pack:
-        raise HTTPException(status_code=404, detail='Not found')
-    return {'handoff_package': serialize_pack(pack), 'units': {'distance': 'km', 'ui_toggle_supported': 'miles'}}
+    return {'handoff_package': load_pack_or_archive(db, pack_id), 'units': {'distance': 'km', 'ui_toggle_supported': 'miles'}}
 
 
 @app.post('/pipeline/run')
-def run_pipeline(db: Session = Depends(get_db), user: User = Depends(get_current_user)):
+def run_pipeline(force: bool = False, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
     if user.role != Role.ADMIN:
         raise HTTPException(status_code=403, detail='Only admins can run pipeline manually')
     created = run_ingestion(db)
-    run_enrichment_and_generation(db)
-    return {'created_content_packs': created}
+    generation = run_enrichment_and_generation(db, force=force)
+    return {'created_content_packs': created, 'generation': generation}
+
+
+@app.get('/pipeline/generators')
+def generator_stats(db: Session = Depends(get_db), user: User = Depends(get_current_user)):
+    return {'latency': generator_latency_percentiles(db)}
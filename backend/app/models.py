@@ -1,7 +1,7 @@
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import Boolean, DateTime, Enum as SQLEnum, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Enum as SQLEnum, Float, ForeignKey, Index, Integer, LargeBinary, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .database import Base
@@ -36,6 +36,17 @@ class User(Base):
 
 class ContentPack(Base):
     __tablename__ = 'content_packs'
+    __table_args__ = (
+        # Review-queue queries only touch live packs; on Postgres keep their index free of archived rows.
+        Index(
+            'ix_content_packs_live_status_created_at',
+            'status',
+            'created_at',
+            postgresql_where=text("status NOT IN ('ARCHIVED', 'POSTED')"),
+        ),
+        # Archived pack ids stay addressable in the cold tier, so ids must never be reused.
+        {'sqlite_autoincrement': True},
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     source_id: Mapped[str] = mapped_column(String(255), unique=True, index=True)
@@ -53,12 +64,14 @@ class ContentPack(Base):
     distance_km: Mapped[float | None] = mapped_column(Float, nullable=True)
     status: Mapped[ContentPackStatus] = mapped_column(SQLEnum(ContentPackStatus), default=ContentPackStatus.NEW, index=True)
     reviewer_notes: Mapped[str] = mapped_column(Text, default='')
+    enrichment_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     drafts: Mapped[list['CreativeDraft']] = relationship(back_populates='content_pack', cascade='all, delete-orphan')
     assets: Mapped[list['Asset']] = relationship(back_populates='content_pack', cascade='all, delete-orphan')
     attribution: Mapped['Attribution | None'] = relationship(back_populates='content_pack', uselist=False, cascade='all, delete-orphan')
+    generator_runs: Mapped[list['GeneratorRun']] = relationship(back_populates='content_pack', cascade='all, delete-orphan')
 
 
 class CreativeDraft(Base):
@@ -72,11 +85,29 @@ class CreativeDraft(Base):
     caption_short: Mapped[str] = mapped_column(Text)
     caption_long: Mapped[str] = mapped_column(Text)
     carousel_outline: Mapped[str] = mapped_column(Text)
+    input_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
     content_pack: Mapped[ContentPack] = relationship(back_populates='drafts')
 
 
+class GeneratorRun(Base):
+    """One generator call for one pack: outcome and latency, kept for retries and latency percentiles."""
+
+    __tablename__ = 'generator_runs'
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    content_pack_id: Mapped[int] = mapped_column(ForeignKey('content_packs.id'), index=True)
+    generator_name: Mapped[str] = mapped_column(String(255), index=True)
+    status: Mapped[str] = mapped_column(String(20))
+    latency_ms: Mapped[float | None] = mapped_column(Float, nullable=True)
+    error: Mapped[str] = mapped_column(Text, default='')
+    input_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    content_pack: Mapped[ContentPack] = relationship(back_populates='generator_runs')
+
+
 class AssetType(str, Enum):
     VIDEO = 'video'
     IMAGE = 'image'
@@ -92,6 +123,9 @@ class Asset(Base):
     provider: Mapped[str] = mapped_column(String(255))
     creator_handle: Mapped[str | None] = mapped_column(String(255), nullable=True)
     local_storage_path: Mapped[str | None] = mapped_column(Text, nullable=True)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
+    size_bytes: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    content_type: Mapped[str | None] = mapped_column(String(255), nullable=True)
     rights_status: Mapped[str] = mapped_column(String(100), default='manual')
 
     content_pack: Mapped[ContentPack] = relationship(back_populates='assets')
@@ -107,3 +141,16 @@ class Attribution(Base):
     safe_to_repost: Mapped[str] = mapped_column(String(20), default='unknown')
 
     content_pack: Mapped[ContentPack] = relationship(back_populates='attribution')
+
+
+class ContentPackArchive(Base):
+    """Cold tier: one compressed JSON snapshot per archived pack, range-partitioned by created_at on Postgres."""
+
+    __tablename__ = 'content_pack_archive'
+    __table_args__ = {'postgresql_partition_by': 'RANGE (created_at)'}
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    source_id: Mapped[str] = mapped_column(String(255), index=True)
+    archived_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    payload: Mapped[bytes] = mapped_column(LargeBinary)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from .interfaces import Enricher, EnrichmentResult, GeneratedDraft, Generator, IngestedItem, Ingestor
+from .taxonomy import TaxonomyTagger, get_default_tagger
 
 LOCATION_DB = {
     'Zurich': (47.3769, 8.5417),
@@ -19,12 +20,19 @@ class MockRSSIngestor(Ingestor):
 
 
 class GlobalContextEnricher(Enricher):
+    def __init__(self, tagger: TaxonomyTagger | None = None):
+        self.tagger = tagger or get_default_tagger()
+        # The taxonomy version is part of the name so fingerprints change when the taxonomy does.
+        self.name = f'global-context-v2+{self.tagger.version[:12]}'
+
     def enrich(self, item: IngestedItem) -> EnrichmentResult:
         tags = ['sport']
         why = {'sport': 'Event is sports-related by source title and summary.'}
-        if 'runner' in item.title.lower():
-            tags.append('athlete')
-            why['athlete'] = 'Title references a specific competitor.'
+        matched_tags, matched_why = self.tagger.tag(item.title, item.summary)
+        for tag in matched_tags:
+            if tag not in tags:
+                tags.append(tag)
+        why.update(matched_why)
 
         lat_lon = LOCATION_DB.get(item.location_name or '', (None, None))
         if item.location_name:
@@ -44,7 +52,7 @@ class GlobalContextEnricher(Enricher):
             longitude=lat_lon[1],
             weather_context=weather,
             weather_coverage_notes=notes,
-            breaking='warning' in item.title.lower(),
+            breaking='hazard' in matched_tags,
         )
 
 
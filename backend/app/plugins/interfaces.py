@@ -35,6 +35,8 @@ class Ingestor(Protocol):
 
 
 class Enricher(Protocol):
+    name: str
+
     def enrich(self, item: IngestedItem) -> EnrichmentResult: ...
 
 
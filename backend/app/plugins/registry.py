@@ -0,0 +1,56 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from ..config import settings
+from .defaults import BasicSocialGenerator
+from .interfaces import Generator
+
+
+@dataclass
+class GeneratorRegistration:
+    generator: Generator
+    timeout_seconds: float
+    max_concurrency: int
+    # One long-lived pool per registration: a call stuck past its timeout keeps holding one of its
+    # ``max_concurrency`` workers (threads can't be killed), so stuck calls never add threads.
+    executor: ThreadPoolExecutor = field(init=False, repr=False, compare=False)
+    stuck: set[Future] = field(default_factory=set, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix=f'gen-{self.name}')
+
+    @property
+    def name(self) -> str:
+        return self.generator.name
+
+    def stuck_workers(self) -> int:
+        self.stuck.difference_update([future for future in list(self.stuck) if future.done()])
+        return len(self.stuck)
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+_GENERATORS: dict[str, GeneratorRegistration] = {}
+
+
+def register_generator(generator: Generator, timeout_seconds: float | None = None, max_concurrency: int | None = None):
+    unregister_generator(generator.name)
+    _GENERATORS[generator.name] = GeneratorRegistration(
+        generator=generator,
+        timeout_seconds=timeout_seconds or settings.generator_timeout_seconds,
+        max_concurrency=max_concurrency or settings.generator_max_concurrency,
+    )
+
+
+def unregister_generator(name: str):
+    registration = _GENERATORS.pop(name, None)
+    if registration is not None:
+        registration.close()
+
+
+def registered_generators() -> list[GeneratorRegistration]:
+    return list(_GENERATORS.values())
+
+
+register_generator(BasicSocialGenerator())
@@ -0,0 +1,191 @@
+import hashlib
+import json
+import os
+import tempfile
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from ..config import settings
+
+AUTOMATON_VERSION = 'aho-corasick-v1'
+CACHE_FORMAT = 1
+DEFAULT_TAXONOMY_PATH = Path(__file__).with_name('taxonomy.json')
+
+
+@dataclass(frozen=True)
+class Keyword:
+    category: str
+    canonical: str
+    alias: str
+
+
+@dataclass
+class TagMatch:
+    keyword: Keyword
+    field: str
+    start: int
+    end: int
+
+
+def normalize(text: str) -> str:
+    return ' '.join(text.lower().split())
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over normalized aliases; one pass over the text finds every alias."""
+
+    def __init__(self, keywords: list[Keyword]):
+        self.keywords = keywords
+        self.goto: list[dict[str, int]] = [{}]
+        self.fail: list[int] = [0]
+        self.output: list[tuple[int, ...]] = [()]
+
+        for index, keyword in enumerate(keywords):
+            state = 0
+            for char in keyword.alias:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                state = next_state
+            self.output[state] += (index,)
+
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                self.output[next_state] += self.output[self.fail[next_state]]
+
+    def to_tables(self) -> dict:
+        return {
+            'format': CACHE_FORMAT,
+            'keywords': [[k.category, k.canonical, k.alias] for k in self.keywords],
+            'goto': self.goto,
+            'fail': self.fail,
+            'output': self.output,
+        }
+
+    @classmethod
+    def from_tables(cls, tables: dict) -> 'KeywordAutomaton':
+        """Rebuild from plain tables written by ``to_tables``; raises ``ValueError`` if they don't fit together."""
+        if tables.get('format') != CACHE_FORMAT:
+            raise ValueError('unsupported automaton cache format')
+        automaton = cls.__new__(cls)
+        automaton.keywords = [Keyword(*map(str, row)) for row in tables['keywords']]
+        automaton.goto = [{str(char): int(state) for char, state in edges.items()} for edges in tables['goto']]
+        automaton.fail = [int(state) for state in tables['fail']]
+        automaton.output = [tuple(int(index) for index in indexes) for indexes in tables['output']]
+        states = len(automaton.goto)
+        if len(automaton.fail) != states or len(automaton.output) != states:
+            raise ValueError('automaton tables have mismatched lengths')
+        if any(not 0 <= state < states for edges in automaton.goto for state in edges.values()):
+            raise ValueError('automaton transition out of range')
+        if any(not 0 <= state < states for state in automaton.fail):
+            raise ValueError('automaton fail link out of range')
+        if any(not 0 <= index < len(automaton.keywords) for indexes in automaton.output for index in indexes):
+            raise ValueError('automaton output out of range')
+        return automaton
+
+    def iter_matches(self, text: str):
+        """Yield ``(start, end, keyword)`` for whole-word matches in already normalized ``text``."""
+        goto, fail, output, keywords = self.goto, self.fail, self.output, self.keywords
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in output[state]:
+                keyword = keywords[index]
+                start = position - len(keyword.alias) + 1
+                end = position + 1
+                if (start == 0 or not text[start - 1].isalnum()) and (end == len(text) or not text[end].isalnum()):
+                    yield start, end, keyword
+
+
+def taxonomy_version(taxonomy: dict) -> str:
+    payload = json.dumps(taxonomy, sort_keys=True).encode()
+    return hashlib.sha256(AUTOMATON_VERSION.encode() + payload).hexdigest()
+
+
+def load_keywords(taxonomy: dict) -> list[Keyword]:
+    """Taxonomy format: ``{category: {canonical: [alias, ...]}}``; the canonical name is always an alias."""
+    keywords = []
+    for category, entries in taxonomy.items():
+        for canonical, aliases in entries.items():
+            for alias in dict.fromkeys([canonical, *aliases]):
+                keywords.append(Keyword(category, canonical, normalize(alias)))
+    return keywords
+
+
+class TaxonomyTagger:
+    def __init__(self, automaton: KeywordAutomaton, version: str):
+        self.automaton = automaton
+        self.version = version
+
+    @classmethod
+    def from_taxonomy(cls, taxonomy: dict) -> 'TaxonomyTagger':
+        return cls(KeywordAutomaton(load_keywords(taxonomy)), taxonomy_version(taxonomy))
+
+    @classmethod
+    def from_file(cls, path: str | Path, cache_dir: str | Path | None = None) -> 'TaxonomyTagger':
+        """Load compiled automaton tables from ``cache_dir`` when present, compiling and caching them otherwise.
+
+        The cache holds plain JSON tables, never code or pickled objects; unreadable or inconsistent
+        files are ignored and rebuilt.
+        """
+        taxonomy = json.loads(Path(path).read_text())
+        version = taxonomy_version(taxonomy)
+        cache_path = Path(cache_dir) / f'taxonomy-{version}.v{CACHE_FORMAT}.json' if cache_dir else None
+        if cache_path and cache_path.exists():
+            try:
+                return cls(KeywordAutomaton.from_tables(json.loads(cache_path.read_text())), version)
+            except (OSError, ValueError, TypeError, KeyError, AttributeError):
+                pass
+
+        tagger = cls(KeywordAutomaton(load_keywords(taxonomy)), version)
+        if cache_path:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+                with os.fdopen(fd, 'w') as fh:
+                    json.dump(tagger.automaton.to_tables(), fh, separators=(',', ':'))
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                pass  # A read-only cache dir only costs the next worker a recompile.
+        return tagger
+
+    def match(self, title: str, summary: str) -> list[TagMatch]:
+        title = normalize(title)
+        text = f'{title}\n{normalize(summary)}'
+        boundary = len(title)
+        matches = []
+        for start, end, keyword in self.automaton.iter_matches(text):
+            if start < boundary:
+                matches.append(TagMatch(keyword, 'title', start, end))
+            else:
+                matches.append(TagMatch(keyword, 'summary', start - boundary - 1, end - boundary - 1))
+        return matches
+
+    def tag(self, title: str, summary: str) -> tuple[list[str], dict[str, str]]:
+        """Return category tags and, per category, the evidence that triggered them."""
+        evidence: dict[str, dict[str, None]] = {}
+        for m in self.match(title, summary):
+            evidence.setdefault(m.keyword.category, {})[f"'{m.keyword.alias}' ({m.keyword.canonical}) in {m.field}"] = None
+        tags = list(evidence)
+        why = {category: 'Matched ' + ', '.join(found) + '.' for category, found in evidence.items()}
+        return tags, why
+
+
+@lru_cache(maxsize=1)
+def get_default_tagger() -> TaxonomyTagger:
+    return TaxonomyTagger.from_file(settings.taxonomy_path or DEFAULT_TAXONOMY_PATH, settings.taxonomy_cache_dir)
@@ -59,6 +59,8 @@ class AssetOut(BaseModel):
     provider: str
     creator_handle: str | None
     local_storage_path: str | None
+    content_hash: str | None = None
+    size_bytes: int | None = None
     rights_status: str
 
     class Config:
@@ -0,0 +1,40 @@
+import json
+
+from .models import ContentPack
+from .schemas import AssetOut, AttributionOut
+
+
+def serialize_pack(pack: ContentPack) -> dict:
+    return {
+        'id': pack.id,
+        'source_id': pack.source_id,
+        'title': pack.title,
+        'summary': pack.summary,
+        'bullets': json.loads(pack.bullets),
+        'tags': json.loads(pack.tags),
+        'why_tagged': json.loads(pack.why_tagged),
+        'location_name': pack.location_name,
+        'latitude': pack.latitude,
+        'longitude': pack.longitude,
+        'weather_context': json.loads(pack.weather_context),
+        'weather_coverage_notes': pack.weather_coverage_notes,
+        'breaking': pack.breaking,
+        'distance_km': pack.distance_km,
+        'status': pack.status,
+        'reviewer_notes': pack.reviewer_notes,
+        'created_at': pack.created_at,
+        'drafts': [
+            {
+                'id': d.id,
+                'generator_name': d.generator_name,
+                'headline_options': json.loads(d.headline_options),
+                'cover_spec': json.loads(d.cover_spec),
+                'caption_short': d.caption_short,
+                'caption_long': d.caption_long,
+                'carousel_outline': json.loads(d.carousel_outline),
+            }
+            for d in pack.drafts
+        ],
+        'assets': [AssetOut.model_validate(a).model_dump() for a in pack.assets],
+        'attribution': AttributionOut.model_validate(pack.attribution).model_dump() if pack.attribution else None,
+    }
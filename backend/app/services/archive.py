@@ -0,0 +1,76 @@
+import json
+import zlib
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..models import ContentPack, ContentPackArchive, ContentPackStatus
+from ..serializers import serialize_pack
+
+COMPRESSION_LEVEL = 9
+
+
+def compress_snapshot(pack: ContentPack) -> tuple[bytes, int]:
+    """Compress the same representation the detail/export endpoints return; also returns the raw size."""
+    raw = json.dumps(jsonable_encoder(serialize_pack(pack)), separators=(',', ':')).encode()
+    return zlib.compress(raw, COMPRESSION_LEVEL), len(raw)
+
+
+def decompress_snapshot(payload: bytes) -> dict:
+    return json.loads(zlib.decompress(payload))
+
+
+def ensure_archive_partition(db: Session, created_at: datetime, known: set[str]):
+    """Create the monthly Postgres partition covering ``created_at``; other databases need none."""
+    if db.get_bind().dialect.name != 'postgresql':
+        return
+    start = created_at.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    end = (start + timedelta(days=32)).replace(day=1)
+    name = f'content_pack_archive_y{start:%Y}m{start:%m}'
+    if name in known:
+        return
+    db.execute(
+        text(
+            f'CREATE TABLE IF NOT EXISTS {name} PARTITION OF content_pack_archive '
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+    )
+    known.add(name)
+
+
+def run_archival(db: Session, older_than_days: int | None = None, batch_size: int = 200) -> dict:
+    """Move ARCHIVED packs untouched for ``older_than_days`` (with drafts, assets and attribution) to cold storage."""
+    older_than_days = settings.archive_after_days if older_than_days is None else older_than_days
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    stats = {'archived': 0, 'raw_bytes': 0, 'compressed_bytes': 0}
+    partitions: set[str] = set()
+
+    while True:
+        packs = (
+            db.query(ContentPack)
+            .filter(ContentPack.status == ContentPackStatus.ARCHIVED, ContentPack.updated_at <= cutoff)
+            .order_by(ContentPack.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not packs:
+            break
+        for pack in packs:
+            payload, raw_size = compress_snapshot(pack)
+            ensure_archive_partition(db, pack.created_at, partitions)
+            db.add(ContentPackArchive(id=pack.id, created_at=pack.created_at, source_id=pack.source_id, payload=payload))
+            db.delete(pack)
+            stats['archived'] += 1
+            stats['raw_bytes'] += raw_size
+            stats['compressed_bytes'] += len(payload)
+        db.commit()
+
+    return stats
+
+
+def load_archived_pack(db: Session, pack_id: int) -> dict | None:
+    row = db.query(ContentPackArchive).filter(ContentPackArchive.id == pack_id).first()
+    return decompress_snapshot(row.payload) if row else None
@@ -0,0 +1,137 @@
+import hashlib
+import logging
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Protocol
+
+import httpx
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..models import Asset
+from .storage import MB, ObjectStore, get_object_store
+
+FETCH_CHUNK_BYTES = MB
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StoredObject:
+    key: str
+    content_hash: str
+    size_bytes: int
+    content_type: str | None
+
+
+class Fetcher(Protocol):
+    def open(self, url: str): ...
+
+
+class HttpFetcher:
+    """Streams remote media over a single pooled httpx client."""
+
+    def __init__(self, client: httpx.Client | None = None, timeout: float = 30.0):
+        self.client = client or httpx.Client(timeout=timeout, follow_redirects=True)
+
+    def close(self):
+        self.client.close()
+
+    def __enter__(self) -> 'HttpFetcher':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @contextmanager
+    def open(self, url: str) -> Iterator[tuple[str | None, Iterator[bytes]]]:
+        with self.client.stream('GET', url) as response:
+            response.raise_for_status()
+            yield response.headers.get('content-type'), response.iter_bytes(FETCH_CHUNK_BYTES)
+
+
+def content_key(content_hash: str) -> str:
+    return f'sha256/{content_hash[:2]}/{content_hash}'
+
+
+def store_remote_object(url: str, store: ObjectStore, fetcher: Fetcher, spool_max_bytes: int) -> StoredObject:
+    """Hash the body while streaming it to a spool file, then upload it once under its content key.
+
+    Bodies larger than ``spool_max_bytes`` spill to disk, so memory use stays bounded.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    with tempfile.SpooledTemporaryFile(max_size=spool_max_bytes) as spool:
+        with fetcher.open(url) as (content_type, chunks):
+            for chunk in chunks:
+                digest.update(chunk)
+                spool.write(chunk)
+                size += len(chunk)
+
+        content_hash = digest.hexdigest()
+        key = content_key(content_hash)
+        if not store.exists(key):
+            spool.seek(0)
+            store.put(key, spool, content_type)
+
+    return StoredObject(key=key, content_hash=content_hash, size_bytes=size, content_type=content_type)
+
+
+def _apply(asset: Asset, stored: StoredObject):
+    asset.local_storage_path = stored.key
+    asset.content_hash = stored.content_hash
+    asset.size_bytes = stored.size_bytes
+    asset.content_type = stored.content_type
+
+
+def run_asset_storage(
+    db: Session,
+    store: ObjectStore | None = None,
+    fetcher: Fetcher | None = None,
+    max_workers: int | None = None,
+) -> dict:
+    if fetcher is None:
+        # A client created here is closed here, so periodic runs don't accumulate connection pools.
+        with HttpFetcher() as owned_fetcher:
+            return run_asset_storage(db, store, owned_fetcher, max_workers)
+
+    store = store or get_object_store()
+    max_workers = max_workers or settings.asset_fetch_workers
+    spool_max_bytes = settings.asset_spool_max_mb * MB
+
+    pending = db.query(Asset).filter(Asset.local_storage_path.is_(None)).all()
+    stats = {'stored': 0, 'reused': 0, 'failed': 0, 'fetched': 0}
+    if not pending:
+        return stats
+
+    # The same clip is often attached to many packs; reuse anything already stored for that URL.
+    urls = {asset.url for asset in pending}
+    known: dict[str, StoredObject] = {}
+    for asset in db.query(Asset).filter(Asset.url.in_(urls), Asset.content_hash.is_not(None)):
+        known[asset.url] = StoredObject(asset.local_storage_path, asset.content_hash, asset.size_bytes, asset.content_type)
+
+    to_fetch = sorted(urls - known.keys())
+    fetched: dict[str, StoredObject] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(store_remote_object, url, store, fetcher, spool_max_bytes): url for url in to_fetch}
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                fetched[url] = future.result()
+            except Exception:
+                # One bad URL (unreachable, malformed, rejected by the store) must not lose the rest of the batch.
+                logger.warning('Failed to store asset %s', url, exc_info=True)
+
+    stats['fetched'] = len(fetched)
+    for asset in pending:
+        stored = known.get(asset.url) or fetched.get(asset.url)
+        if stored is None:
+            stats['failed'] += 1
+            continue
+        _apply(asset, stored)
+        stats['reused' if asset.url in known else 'stored'] += 1
+
+    db.commit()
+    return stats
@@ -0,0 +1,239 @@
+import hashlib
+import io
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFont
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..models import Asset, AssetType, ContentPack, ContentPackStatus, CreativeDraft
+from .storage import ObjectStore, get_object_store
+
+RENDERER_VERSION = 'cover-renderer-v1'
+RENDER_PROVIDER = 'cover-renderer'
+CANVAS_SIZE = (1080, 1350)
+MARGIN = 80
+
+TEMPLATES = {
+    'high-contrast': {'background': (12, 12, 12), 'title': (255, 255, 255), 'subtitle': (255, 214, 0), 'title_size': 88, 'subtitle_size': 44},
+    'default': {'background': (245, 245, 240), 'title': (20, 20, 20), 'subtitle': (90, 90, 90), 'title_size': 80, 'subtitle_size': 40},
+}
+SKIP_STATUSES = [ContentPackStatus.ARCHIVED, ContentPackStatus.POSTED]
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    title: str
+    subtitle: str
+    style: str
+    image_format: str = 'png'
+
+    @property
+    def spec_hash(self) -> str:
+        # Everything that changes the rendered pixels: a new font or template yields a new key.
+        payload = json.dumps(
+            {
+                'renderer': RENDERER_VERSION,
+                'font': settings.cover_font_path,
+                'template': template_for(self.style),
+                'title': self.title,
+                'subtitle': self.subtitle,
+                'style': self.style,
+                'format': self.image_format,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @property
+    def key(self) -> str:
+        return f'covers/{self.spec_hash[:2]}/{self.spec_hash}.{self.image_format}'
+
+
+def template_for(style: str) -> dict:
+    for name, template in TEMPLATES.items():
+        if name in style:
+            return template
+    return TEMPLATES['default']
+
+
+@lru_cache(maxsize=32)
+def load_font(size: int) -> ImageFont.FreeTypeFont:
+    # Fonts are parsed once per worker process and reused for every cover.
+    if settings.cover_font_path:
+        return ImageFont.truetype(settings.cover_font_path, size)
+    return ImageFont.load_default(size)
+
+
+@lru_cache(maxsize=4096)
+def text_width(text: str, size: int) -> int:
+    left, _, right, _ = load_font(size).getbbox(text)
+    return right - left
+
+
+@lru_cache(maxsize=4096)
+def wrap_text(text: str, size: int, max_width: int) -> tuple[str, ...]:
+    lines: list[str] = []
+    current = ''
+    for word in text.split():
+        candidate = f'{current} {word}'.strip()
+        if current and text_width(candidate, size) > max_width:
+            lines.append(current)
+            current = word
+        else:
+            current = candidate
+    if current:
+        lines.append(current)
+    return tuple(lines)
+
+
+def render_job(job: RenderJob) -> bytes:
+    template = template_for(job.style)
+    image = Image.new('RGB', CANVAS_SIZE, template['background'])
+    draw = ImageDraw.Draw(image)
+    max_width = CANVAS_SIZE[0] - 2 * MARGIN
+
+    y = MARGIN * 3
+    for size, color, text in (
+        (template['title_size'], template['title'], job.title),
+        (template['subtitle_size'], template['subtitle'], job.subtitle),
+    ):
+        font = load_font(size)
+        for line in wrap_text(text, size, max_width):
+            draw.text((MARGIN, y), line, font=font, fill=color)
+            y += int(size * 1.2)
+        y += size
+
+    out = io.BytesIO()
+    image.save(out, format='JPEG' if job.image_format == 'jpeg' else 'PNG')
+    return out.getvalue()
+
+
+def _warm_worker():
+    for template in TEMPLATES.values():
+        load_font(template['title_size'])
+        load_font(template['subtitle_size'])
+
+
+def can_spawn_processes() -> bool:
+    """Daemonic processes (e.g. Celery prefork pool workers) may not start children."""
+    if multiprocessing.current_process().daemon:
+        return False
+    try:
+        from billiard.process import current_process as billiard_current_process
+    except ImportError:
+        return True
+    return not billiard_current_process().daemon
+
+
+def render_batch(jobs: list[RenderJob], processes: int | None = None) -> list[bytes]:
+    """Render jobs in order; batches above ``processes`` items are spread over a process pool.
+
+    Inside a daemonic worker the batch is rendered in-process instead.
+    """
+    processes = processes or settings.cover_render_processes
+    if processes <= 1 or len(jobs) <= processes or not can_spawn_processes():
+        return [render_job(job) for job in jobs]
+    chunksize = max(1, len(jobs) // (processes * 4))
+    with ProcessPoolExecutor(max_workers=processes, initializer=_warm_worker) as pool:
+        return list(pool.map(render_job, jobs, chunksize=chunksize))
+
+
+def jobs_for_draft(draft: CreativeDraft, image_format: str = 'png') -> list[RenderJob]:
+    cover_spec = json.loads(draft.cover_spec)
+    style = cover_spec.get('style', '')
+    jobs = [RenderJob(cover_spec.get('title', ''), cover_spec.get('subtitle', ''), style, image_format)]
+    for slide in json.loads(draft.carousel_outline):
+        jobs.append(RenderJob(slide.get('title', ''), slide.get('body', ''), style, image_format))
+    return jobs
+
+
+def latest_drafts(db: Session) -> list[CreativeDraft]:
+    """Newest draft per (pack, generator) for packs that are still live; superseded drafts are never rendered."""
+    latest_ids = (
+        db.query(func.max(CreativeDraft.id))
+        .join(ContentPack)
+        .filter(ContentPack.status.not_in(SKIP_STATUSES))
+        .group_by(CreativeDraft.content_pack_id, CreativeDraft.generator_name)
+    )
+    return db.query(CreativeDraft).filter(CreativeDraft.id.in_(latest_ids)).all()
+
+
+def run_cover_rendering(db: Session, store: ObjectStore | None = None, processes: int | None = None) -> dict:
+    store = store or get_object_store()
+    image_format = settings.cover_format
+
+    drafts = latest_drafts(db)
+    current: dict[int, set[str]] = {}
+    wanted_jobs: list[tuple[ContentPack, RenderJob]] = []
+    for draft in drafts:
+        for job in jobs_for_draft(draft, image_format):
+            current.setdefault(draft.content_pack_id, set()).add(f'spec:{job.spec_hash}')
+            wanted_jobs.append((draft.content_pack, job))
+
+    # Covers of superseded drafts (or older font/template settings) are dropped so a pack only lists current ones.
+    removed = 0
+    rendered_for_pack: set[tuple[int, str]] = set()
+    for asset in db.query(Asset).filter(Asset.provider == RENDER_PROVIDER, Asset.content_pack_id.in_(current)):
+        if asset.url in current[asset.content_pack_id]:
+            rendered_for_pack.add((asset.content_pack_id, asset.url))
+        else:
+            db.delete(asset)
+            removed += 1
+
+    wanted: list[tuple[ContentPack, RenderJob]] = []
+    for pack, job in wanted_jobs:
+        if (pack.id, f'spec:{job.spec_hash}') not in rendered_for_pack:
+            wanted.append((pack, job))
+            rendered_for_pack.add((pack.id, f'spec:{job.spec_hash}'))
+
+    # Identical specs are rendered once, and not at all if another pack's row or the store already has them.
+    unique_jobs = {job.spec_hash: job for _, job in wanted}
+    outputs: dict[str, tuple[str | None, int | None]] = {}
+    for asset in db.query(Asset).filter(Asset.provider == RENDER_PROVIDER, Asset.url.in_([f'spec:{h}' for h in unique_jobs])):
+        if asset.content_hash is not None:
+            outputs[asset.url.removeprefix('spec:')] = (asset.content_hash, asset.size_bytes)
+    to_render = []
+    for spec_hash, job in unique_jobs.items():
+        if spec_hash in outputs:
+            continue
+        info = store.head(job.key)
+        if info is None:
+            to_render.append(job)
+        else:
+            outputs[spec_hash] = (info.content_hash, info.size_bytes)
+
+    content_type = 'image/jpeg' if image_format == 'jpeg' else 'image/png'
+    for job, body in zip(to_render, render_batch(to_render, processes)):
+        content_hash = hashlib.sha256(body).hexdigest()
+        store.put(job.key, io.BytesIO(body), content_type, metadata={'sha256': content_hash})
+        outputs[job.spec_hash] = (content_hash, len(body))
+
+    for pack, job in wanted:
+        content_hash, size_bytes = outputs[job.spec_hash]
+        db.add(
+            Asset(
+                content_pack=pack,
+                url=f'spec:{job.spec_hash}',
+                type=AssetType.IMAGE,
+                provider=RENDER_PROVIDER,
+                local_storage_path=job.key,
+                content_hash=content_hash,
+                size_bytes=size_bytes,
+                content_type=content_type,
+                rights_status='owned',
+            )
+        )
+
+    db.commit()
+    return {
+        'rendered': len(to_render),
+        'assets_created': len(wanted),
+        'assets_removed': removed,
+        'skipped_specs': len(unique_jobs) - len(to_render),
+    }
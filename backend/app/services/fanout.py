@@ -0,0 +1,108 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass
+from typing import Hashable
+
+from ..plugins.interfaces import EnrichmentResult, GeneratedDraft, IngestedItem
+from ..plugins.registry import GeneratorRegistration
+
+POLL_SECONDS = 0.01
+
+
+def summarize(sorted_samples: list[float]) -> dict:
+    def pick(q: float) -> float:
+        index = max(0, int(round(q * len(sorted_samples))) - 1)
+        return round(sorted_samples[index] * 1000, 2)
+
+    if not sorted_samples:
+        return {'count': 0, 'p50_ms': None, 'p95_ms': None, 'p99_ms': None}
+    return {'count': len(sorted_samples), 'p50_ms': pick(0.50), 'p95_ms': pick(0.95), 'p99_ms': pick(0.99)}
+
+
+@dataclass
+class GenerationOutcome:
+    generator_name: str
+    status: str  # ok | error | timeout | cancelled
+    draft: GeneratedDraft | None = None
+    latency_seconds: float | None = None
+    error: str | None = None
+
+
+@dataclass
+class _Call:
+    key: Hashable
+    registration: GeneratorRegistration
+    started_at: float | None = None
+
+
+class GeneratorFanOut:
+    """Runs every (item, generator) pair concurrently.
+
+    Calls go to each registration's long-lived pool of ``max_concurrency`` workers. A call running past the
+    generator's ``timeout_seconds`` is reported as ``timeout`` and abandoned, but its thread can't be killed and
+    keeps its worker until the call returns. Once every worker of a generator is stuck, its queued calls are
+    cancelled and, on later runs, new calls are refused as ``cancelled`` until a worker frees up, so a hung
+    generator costs at most ``max_concurrency`` threads per process.
+    """
+
+    def __init__(self, registrations: list[GeneratorRegistration]):
+        self.registrations = registrations
+
+    def run(self, items: dict[Hashable, tuple[IngestedItem, EnrichmentResult, list[str]]]) -> dict[tuple[Hashable, str], GenerationOutcome]:
+        """``items`` maps a caller key to the item, its enrichment and the generator names to run."""
+        by_name = {reg.name: reg for reg in self.registrations}
+        saturated = {reg.name for reg in self.registrations if reg.stuck_workers() >= reg.max_concurrency}
+        calls: dict[Future, _Call] = {}
+        outcomes: dict[tuple[Hashable, str], GenerationOutcome] = {}
+        pending: set[Future] = set()
+
+        def invoke(call: _Call, item: IngestedItem, enrichment: EnrichmentResult) -> GeneratedDraft:
+            call.started_at = time.monotonic()
+            return call.registration.generator.generate(item, enrichment)
+
+        try:
+            for key, (item, enrichment, names) in items.items():
+                for name in names:
+                    if name in saturated:
+                        outcomes[key, name] = GenerationOutcome(name, 'cancelled', error='all workers timed out')
+                        continue
+                    call = _Call(key, by_name[name])
+                    future = by_name[name].executor.submit(invoke, call, item, enrichment)
+                    calls[future] = call
+                    pending.add(future)
+
+            while pending:
+                done, pending = wait(pending, timeout=POLL_SECONDS, return_when=FIRST_COMPLETED)
+                now = time.monotonic()
+                for future in done:
+                    call = calls[future]
+                    latency = now - (call.started_at or now)
+                    name = call.registration.name
+                    try:
+                        outcomes[call.key, name] = GenerationOutcome(name, 'ok', future.result(), latency)
+                    except Exception as exc:
+                        outcomes[call.key, name] = GenerationOutcome(name, 'error', latency_seconds=latency, error=str(exc))
+
+                for future in list(pending):
+                    call = calls[future]
+                    reg = call.registration
+                    if call.started_at is not None and now - call.started_at > reg.timeout_seconds:
+                        pending.discard(future)
+                        reg.stuck.add(future)
+                        outcomes[call.key, reg.name] = GenerationOutcome(
+                            reg.name, 'timeout', latency_seconds=now - call.started_at, error=f'exceeded {reg.timeout_seconds}s'
+                        )
+
+                for reg in self.registrations:
+                    if reg.stuck_workers() < reg.max_concurrency:
+                        continue
+                    for future in list(pending):
+                        call = calls[future]
+                        if call.registration is reg and future.cancel():
+                            pending.discard(future)
+                            outcomes[call.key, reg.name] = GenerationOutcome(reg.name, 'cancelled', error='all workers timed out')
+        finally:
+            for future in pending:
+                future.cancel()
+
+        return outcomes
@@ -1,10 +1,16 @@
+import hashlib
 import json
+from dataclasses import asdict
 
+from sqlalchemy import and_, exists, func, or_, select
 from sqlalchemy.orm import Session
 
-from ..models import Attribution, ContentPack, ContentPackStatus, CreativeDraft
-from ..plugins.defaults import BasicSocialGenerator, GlobalContextEnricher, MockRSSIngestor
-from ..plugins.interfaces import Enricher, Generator, IngestedItem, Ingestor
+from ..config import settings
+from ..models import Attribution, ContentPack, ContentPackArchive, ContentPackStatus, CreativeDraft, GeneratorRun
+from ..plugins.defaults import GlobalContextEnricher, MockRSSIngestor
+from ..plugins.interfaces import Enricher, EnrichmentResult, Generator, IngestedItem, Ingestor
+from ..plugins.registry import GeneratorRegistration, registered_generators
+from .fanout import GeneratorFanOut, summarize
 
 ALLOWED_TRANSITIONS = {
     ContentPackStatus.NEW: {ContentPackStatus.ENRICHED},
@@ -16,6 +22,8 @@ ALLOWED_TRANSITIONS = {
     ContentPackStatus.SCHEDULED: {ContentPackStatus.POSTED},
     ContentPackStatus.POSTED: {ContentPackStatus.ARCHIVED},
 }
+# Calls that started and failed; ``cancelled`` calls never ran and don't use up an attempt.
+ATTEMPT_FAILURES = ('error', 'timeout')
 
 
 def set_status(pack: ContentPack, target: ContentPackStatus):
@@ -28,7 +36,9 @@ def set_status(pack: ContentPack, target: ContentPackStatus):
 
 
 def dedupe_by_source(db: Session, item: IngestedItem) -> bool:
-    return db.query(ContentPack).filter(ContentPack.source_id == item.source_id).first() is not None
+    if db.query(ContentPack).filter(ContentPack.source_id == item.source_id).first() is not None:
+        return True
+    return db.query(ContentPackArchive).filter(ContentPackArchive.source_id == item.source_id).first() is not None
 
 
 def run_ingestion(db: Session, ingestor: Ingestor | None = None):
@@ -45,41 +55,168 @@ def run_ingestion(db: Session, ingestor: Ingestor | None = None):
     return created
 
 
-def run_enrichment_and_generation(db: Session, enricher: Enricher | None = None, generator: Generator | None = None):
+def fingerprint(*parts) -> str:
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def latest_draft(pack: ContentPack, generator_name: str) -> CreativeDraft | None:
+    drafts = [d for d in pack.drafts if d.generator_name == generator_name and d.id is not None]
+    return max(drafts, key=lambda d: d.id, default=None)
+
+
+def failed_attempts(pack: ContentPack, generator_name: str) -> int:
+    return sum(1 for run in pack.generator_runs if run.generator_name == generator_name and run.status in ATTEMPT_FAILURES)
+
+
+def packs_missing_drafts(db: Session, names: list[str]) -> list[ContentPack]:
+    """DRAFT_READY packs lacking a draft from some generator that still has retry attempts left."""
+    conditions = []
+    for name in names:
+        has_draft = exists().where(CreativeDraft.content_pack_id == ContentPack.id, CreativeDraft.generator_name == name)
+        failures = (
+            select(func.count(GeneratorRun.id))
+            .where(GeneratorRun.content_pack_id == ContentPack.id, GeneratorRun.generator_name == name, GeneratorRun.status.in_(ATTEMPT_FAILURES))
+            .scalar_subquery()
+        )
+        conditions.append(and_(~has_draft, failures < settings.generator_max_attempts))
+    if not conditions:
+        return []
+    return db.query(ContentPack).filter(ContentPack.status == ContentPackStatus.DRAFT_READY, or_(*conditions)).all()
+
+
+def generator_latency_percentiles(db: Session, window: int = 1000) -> dict[str, dict]:
+    """Latency percentiles over the last ``window`` recorded calls of each generator, across all processes."""
+    names = [name for (name,) in db.query(GeneratorRun.generator_name).distinct()]
+    percentiles = {}
+    for name in names:
+        samples = [
+            latency_ms / 1000
+            for (latency_ms,) in db.query(GeneratorRun.latency_ms)
+            .filter(GeneratorRun.generator_name == name, GeneratorRun.latency_ms.is_not(None))
+            .order_by(GeneratorRun.id.desc())
+            .limit(window)
+        ]
+        percentiles[name] = summarize(sorted(samples))
+    return percentiles
+
+
+def enrichment_from_pack(pack: ContentPack) -> EnrichmentResult:
+    return EnrichmentResult(
+        tags=json.loads(pack.tags),
+        why_tagged=json.loads(pack.why_tagged),
+        latitude=pack.latitude,
+        longitude=pack.longitude,
+        weather_context=json.loads(pack.weather_context),
+        weather_coverage_notes=pack.weather_coverage_notes,
+        breaking=pack.breaking,
+    )
+
+
+def run_enrichment_and_generation(
+    db: Session,
+    enricher: Enricher | None = None,
+    generator: Generator | None = None,
+    force: bool = False,
+    generators: list[GeneratorRegistration] | None = None,
+) -> dict:
+    """Enrich NEW/ENRICHED packs and fan each one out to every registered generator.
+
+    Stages whose input fingerprint is unchanged are skipped; ``force`` re-runs them regardless.
+    Passing ``generator`` runs just that generator with the default time budget. Every call is
+    recorded as a ``GeneratorRun``. A generator that failed or timed out for a pack is retried on
+    later runs, up to ``generator_max_attempts``, even after the pack reached DRAFT_READY; calls
+    cancelled before they started are retried without counting as an attempt. A pack with no draft
+    at all stays ENRICHED.
+    """
     enricher = enricher or GlobalContextEnricher()
-    generator = generator or BasicSocialGenerator()
+    if generator is not None:
+        generators = [GeneratorRegistration(generator, settings.generator_timeout_seconds, settings.generator_max_concurrency)]
+    generators = generators or registered_generators()
+    stats = {'packs': 0, 'enriched': 0, 'enrich_skipped': 0, 'generated': 0, 'generate_skipped': 0, 'generate_failed': 0, 'generate_cancelled': 0, 'generate_exhausted': 0}
 
     packs = db.query(ContentPack).filter(ContentPack.status.in_([ContentPackStatus.NEW, ContentPackStatus.ENRICHED])).all()
+    packs += packs_missing_drafts(db, [registration.name for registration in generators])
+    work: dict[int, tuple[IngestedItem, EnrichmentResult, list[str]]] = {}
+    fingerprints: dict[tuple[int, str], str] = {}
     for pack in packs:
+        stats['packs'] += 1
         item = IngestedItem(pack.source_id, pack.title, pack.summary, pack.location_name)
-        enrichment = enricher.enrich(item)
 
-        pack.tags = json.dumps(enrichment.tags)
-        pack.why_tagged = json.dumps(enrichment.why_tagged)
-        pack.latitude = enrichment.latitude
-        pack.longitude = enrichment.longitude
-        pack.weather_context = json.dumps(enrichment.weather_context)
-        pack.weather_coverage_notes = enrichment.weather_coverage_notes
-        pack.breaking = enrichment.breaking
+        enrichment_fp = fingerprint(asdict(item), enricher.name)
+        if not force and pack.enrichment_fingerprint == enrichment_fp:
+            enrichment = enrichment_from_pack(pack)
+            stats['enrich_skipped'] += 1
+        else:
+            enrichment = enricher.enrich(item)
+            pack.tags = json.dumps(enrichment.tags)
+            pack.why_tagged = json.dumps(enrichment.why_tagged)
+            pack.latitude = enrichment.latitude
+            pack.longitude = enrichment.longitude
+            pack.weather_context = json.dumps(enrichment.weather_context)
+            pack.weather_coverage_notes = enrichment.weather_coverage_notes
+            pack.breaking = enrichment.breaking
+            pack.enrichment_fingerprint = enrichment_fp
+            stats['enriched'] += 1
 
         if pack.status == ContentPackStatus.NEW:
             set_status(pack, ContentPackStatus.ENRICHED)
 
-        draft = generator.generate(item, enrichment)
+        names = []
+        for registration in generators:
+            draft_fp = fingerprint(asdict(item), asdict(enrichment), enricher.name, registration.name)
+            latest = latest_draft(pack, registration.name)
+            if not force and latest is not None and latest.input_fingerprint == draft_fp:
+                stats['generate_skipped'] += 1
+                continue
+            if not force and latest is None and failed_attempts(pack, registration.name) >= settings.generator_max_attempts:
+                stats['generate_exhausted'] += 1
+                continue
+            fingerprints[pack.id, registration.name] = draft_fp
+            names.append(registration.name)
+        if names:
+            work[pack.id] = (item, enrichment, names)
+
+    outcomes = GeneratorFanOut(generators).run(work)
+    latencies: dict[str, list[float]] = {registration.name: [] for registration in generators}
+    by_id = {pack.id: pack for pack in packs}
+    for (pack_id, name), outcome in outcomes.items():
+        if outcome.latency_seconds is not None:
+            latencies[name].append(outcome.latency_seconds)
+        db.add(
+            GeneratorRun(
+                content_pack=by_id[pack_id],
+                generator_name=name,
+                status=outcome.status,
+                latency_ms=outcome.latency_seconds * 1000 if outcome.latency_seconds is not None else None,
+                error=outcome.error or '',
+                input_fingerprint=fingerprints[pack_id, name],
+            )
+        )
+        if outcome.status != 'ok':
+            stats['generate_cancelled' if outcome.status == 'cancelled' else 'generate_failed'] += 1
+            continue
+        draft = outcome.draft
         db.add(
             CreativeDraft(
-                content_pack=pack,
-                generator_name=generator.name,
+                content_pack=by_id[pack_id],
+                generator_name=name,
                 headline_options=json.dumps(draft.headline_options),
                 cover_spec=json.dumps(draft.cover_spec),
                 caption_short=draft.caption_short,
                 caption_long=draft.caption_long,
                 carousel_outline=json.dumps(draft.carousel_outline),
+                input_fingerprint=fingerprints[pack_id, name],
             )
         )
+        stats['generated'] += 1
+
+    for pack in packs:
         if not pack.attribution:
             db.add(Attribution(content_pack=pack, required_credit_line='TBD by reviewer', notes='Verify source rights.', safe_to_repost='unknown'))
-
-        set_status(pack, ContentPackStatus.DRAFT_READY)
+        if pack.drafts:
+            set_status(pack, ContentPackStatus.DRAFT_READY)
 
     db.commit()
+    stats['generators'] = {name: summarize(sorted(samples)) for name, samples in latencies.items()}
+    return stats
@@ -0,0 +1,147 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import BinaryIO, Protocol
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from ..config import settings
+
+MB = 1024 * 1024
+
+
+@dataclass
+class ObjectInfo:
+    size_bytes: int
+    content_hash: str | None
+
+
+class ObjectStore(Protocol):
+    def exists(self, key: str) -> bool: ...
+
+    def head(self, key: str) -> ObjectInfo | None: ...
+
+    def put(self, key: str, fileobj: BinaryIO, content_type: str | None = None, metadata: dict[str, str] | None = None) -> None: ...
+
+
+class S3ObjectStore:
+    """S3/MinIO store. One client per process; its connection pool is shared by every upload thread."""
+
+    def __init__(
+        self,
+        bucket: str,
+        endpoint_url: str | None = None,
+        access_key: str | None = None,
+        secret_key: str | None = None,
+        max_pool_connections: int = 20,
+        multipart_chunk_mb: int = 8,
+        upload_concurrency: int = 4,
+        client=None,
+    ):
+        self.bucket = bucket
+        self.client = client or boto3.client(
+            's3',
+            endpoint_url=endpoint_url,
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+            config=Config(max_pool_connections=max_pool_connections, s3={'addressing_style': 'path'}),
+        )
+        self.transfer_config = TransferConfig(
+            multipart_threshold=multipart_chunk_mb * MB,
+            multipart_chunksize=multipart_chunk_mb * MB,
+            max_concurrency=upload_concurrency,
+        )
+        self._bucket_checked = False
+
+    def ensure_bucket(self):
+        if self._bucket_checked:
+            return
+        try:
+            self.client.head_bucket(Bucket=self.bucket)
+        except ClientError:
+            self.client.create_bucket(Bucket=self.bucket)
+        self._bucket_checked = True
+
+    def head(self, key: str) -> ObjectInfo | None:
+        self.ensure_bucket()
+        try:
+            response = self.client.head_object(Bucket=self.bucket, Key=key)
+        except ClientError as exc:
+            if exc.response.get('Error', {}).get('Code') in {'404', 'NoSuchKey', 'NotFound'}:
+                return None
+            raise
+        return ObjectInfo(response['ContentLength'], response.get('Metadata', {}).get('sha256'))
+
+    def exists(self, key: str) -> bool:
+        return self.head(key) is not None
+
+    def put(self, key: str, fileobj: BinaryIO, content_type: str | None = None, metadata: dict[str, str] | None = None) -> None:
+        self.ensure_bucket()
+        extra_args = {}
+        if content_type:
+            extra_args['ContentType'] = content_type
+        if metadata:
+            extra_args['Metadata'] = metadata
+        # upload_fileobj switches to concurrent multipart parts above the threshold.
+        self.client.upload_fileobj(fileobj, self.bucket, key, ExtraArgs=extra_args or None, Config=self.transfer_config)
+
+
+class LocalObjectStore:
+    """Filesystem store used for local development and tests."""
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    def head(self, key: str) -> ObjectInfo | None:
+        path = self._path(key)
+        if not path.exists():
+            return None
+        digest = hashlib.sha256()
+        with open(path, 'rb') as fh:
+            for chunk in iter(lambda: fh.read(MB), b''):
+                digest.update(chunk)
+        return ObjectInfo(path.stat().st_size, digest.hexdigest())
+
+    def put(self, key: str, fileobj: BinaryIO, content_type: str | None = None, metadata: dict[str, str] | None = None) -> None:
+        path = self._path(key)
+        if path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Each writer gets its own temp file; concurrent puts of the same key then race only on the atomic rename.
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.part')
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                shutil.copyfileobj(fileobj, out, MB)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+
+@lru_cache(maxsize=1)
+def get_object_store() -> ObjectStore:
+    if settings.storage_backend == 'local':
+        return LocalObjectStore(settings.local_storage_root)
+    return S3ObjectStore(
+        bucket=settings.s3_bucket,
+        endpoint_url=settings.s3_endpoint_url,
+        access_key=settings.s3_access_key,
+        secret_key=settings.s3_secret_key,
+        max_pool_connections=settings.s3_max_pool_connections,
+        multipart_chunk_mb=settings.s3_multipart_chunk_mb,
+        upload_concurrency=settings.s3_upload_concurrency,
+    )
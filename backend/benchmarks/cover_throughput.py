@@ -0,0 +1,28 @@
+"""Cover rendering throughput in covers/sec per core.
+
+Usage: PYTHONPATH=. python benchmarks/cover_throughput.py [covers] [processes]
+"""
+import sys
+import time
+
+from app.services.covers import RenderJob, render_batch
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    jobs = [
+        RenderJob(f'Trail runner wins alpine stage number {i}', f'Location: Zurich #{i}', 'high-contrast, mobile first')
+        for i in range(count)
+    ]
+
+    for workers in sorted({1, processes}):
+        start = time.perf_counter()
+        render_batch(jobs, processes=workers)
+        elapsed = time.perf_counter() - start
+        rate = count / elapsed
+        print(f'processes={workers} covers={count} elapsed={elapsed:.2f}s covers/sec={rate:.1f} covers/sec/core={rate / workers:.1f}')
+
+
+if __name__ == '__main__':
+    main()
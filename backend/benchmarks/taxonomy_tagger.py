@@ -0,0 +1,64 @@
+"""Taxonomy tagging throughput: compiled automaton vs. per-keyword substring checks.
+
+Usage: PYTHONPATH=. python benchmarks/taxonomy_tagger.py [keywords] [items]
+"""
+import json
+import random
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from app.plugins.taxonomy import TaxonomyTagger, load_keywords
+
+
+def random_word(rng: random.Random) -> str:
+    return ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10)))
+
+
+def main():
+    keyword_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    item_count = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+    rng = random.Random(7)
+    categories = ['sport', 'athlete', 'team', 'venue', 'hazard']
+    taxonomy = {category: {} for category in categories}
+    for i in range(keyword_count):
+        canonical = ' '.join(random_word(rng) for _ in range(rng.randint(1, 2)))
+        taxonomy[categories[i % len(categories)]][canonical] = [random_word(rng)]
+    aliases = [k.alias for k in load_keywords(taxonomy)]
+    items = [
+        (' '.join(rng.choice(aliases) if rng.random() < 0.1 else random_word(rng) for _ in range(12)),
+         ' '.join(rng.choice(aliases) if rng.random() < 0.05 else random_word(rng) for _ in range(40)))
+        for _ in range(item_count)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'taxonomy.json'
+        path.write_text(json.dumps(taxonomy))
+        start = time.perf_counter()
+        TaxonomyTagger.from_file(path, tmp)
+        compile_s = time.perf_counter() - start
+        start = time.perf_counter()
+        tagger = TaxonomyTagger.from_file(path, tmp)
+        load_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for title, summary in items:
+        tagger.tag(title, summary)
+    automaton_s = time.perf_counter() - start
+
+    sample = items[: max(1, item_count // 20)]
+    start = time.perf_counter()
+    for title, summary in sample:
+        text = f'{title} {summary}'
+        [alias for alias in aliases if alias in text]
+    naive_s = (time.perf_counter() - start) * item_count / len(sample)
+
+    print(f'keywords={len(aliases)} items={item_count}')
+    print(f'compile={compile_s:.2f}s cached_load={load_s:.3f}s')
+    print(f'automaton={item_count / automaton_s:.0f} items/sec naive_substring~={item_count / naive_s:.0f} items/sec')
+
+
+if __name__ == '__main__':
+    main()
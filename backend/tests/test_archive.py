@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import Asset, AssetType, Attribution, ContentPack, ContentPackArchive, ContentPackStatus, CreativeDraft
+from app.plugins.interfaces import IngestedItem
+from app.schemas import ContentPackOut
+from app.serializers import serialize_pack
+from app.services.archive import load_archived_pack, run_archival
+from app.services.pipeline import dedupe_by_source
+
+
+def make_pack(source_id: str, status: ContentPackStatus, updated_at: datetime) -> ContentPack:
+    pack = ContentPack(source_id=source_id, title='Trail runner wins', summary='s', status=status, updated_at=updated_at)
+    pack.drafts.append(
+        CreativeDraft(
+            generator_name='basic-social-v1',
+            headline_options='["h"]',
+            cover_spec='{"title": "t"}',
+            caption_short='c',
+            caption_long='cc',
+            carousel_outline='[]',
+        )
+    )
+    pack.assets.append(Asset(url='https://cdn.example/a.jpg', type=AssetType.IMAGE, provider='x', content_hash='ab' * 32))
+    pack.attribution = Attribution(required_credit_line='Photo: X')
+    return pack
+
+
+def test_archival_moves_old_archived_packs_to_cold_storage():
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    old = datetime.utcnow() - timedelta(days=60)
+    db.add(make_pack('old', ContentPackStatus.ARCHIVED, old))
+    db.add(make_pack('recent', ContentPackStatus.ARCHIVED, datetime.utcnow()))
+    db.add(make_pack('live', ContentPackStatus.IN_REVIEW, old))
+    db.commit()
+    old_pack = db.query(ContentPack).filter(ContentPack.source_id == 'old').one()
+    old_id = old_pack.id
+    live_response = jsonable_encoder(serialize_pack(old_pack))
+
+    stats = run_archival(db, older_than_days=30)
+
+    assert stats['archived'] == 1
+    assert 0 < stats['compressed_bytes'] < stats['raw_bytes']
+    assert {p.source_id for p in db.query(ContentPack)} == {'recent', 'live'}
+    assert db.query(CreativeDraft).count() == 2
+    assert db.query(ContentPackArchive).count() == 1
+
+    assert load_archived_pack(db, old_id) == live_response
+    restored = ContentPackOut.model_validate(load_archived_pack(db, old_id))
+    assert restored.source_id == 'old'
+    assert restored.status == ContentPackStatus.ARCHIVED
+    assert restored.drafts[0].headline_options == ['h']
+    assert restored.assets[0].content_hash == 'ab' * 32
+    assert restored.attribution.required_credit_line == 'Photo: X'
+    assert dedupe_by_source(db, IngestedItem('old', 't', 's', None)) is True
+    assert load_archived_pack(db, 9999) is None
@@ -0,0 +1,137 @@
+import io
+import threading
+from contextlib import contextmanager
+
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import Asset, AssetType, ContentPack
+from app.services.assets import HttpFetcher, content_key, run_asset_storage
+from app.services.storage import LocalObjectStore
+
+
+class FakeFetcher:
+    def __init__(self, bodies: dict[str, bytes]):
+        self.bodies = bodies
+        self.calls: list[str] = []
+
+    @contextmanager
+    def open(self, url: str):
+        self.calls.append(url)
+        if url not in self.bodies:
+            raise httpx.HTTPError(f'404 for {url}')
+        body = self.bodies[url]
+        yield 'video/mp4', (body[i:i + 4] for i in range(0, len(body), 4))
+
+
+def make_session():
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)()
+
+
+def test_assets_are_stored_once_per_content_hash(tmp_path):
+    db = make_session()
+    for i in range(3):
+        pack = ContentPack(source_id=f'evt-{i}', title='t', summary='s')
+        db.add(pack)
+        db.add(Asset(content_pack=pack, url='https://cdn.example/clip.mp4', type=AssetType.VIDEO, provider='x'))
+    db.add(Asset(content_pack=pack, url='https://mirror.example/clip.mp4', type=AssetType.VIDEO, provider='x'))
+    db.commit()
+
+    store = LocalObjectStore(tmp_path)
+    body = b'same viral clip bytes'
+    fetcher = FakeFetcher({'https://cdn.example/clip.mp4': body, 'https://mirror.example/clip.mp4': body})
+
+    stats = run_asset_storage(db, store=store, fetcher=fetcher, max_workers=2)
+
+    assert stats == {'stored': 4, 'reused': 0, 'failed': 0, 'fetched': 2}
+    assets = db.query(Asset).all()
+    assert len({a.content_hash for a in assets}) == 1
+    assert all(a.size_bytes == len(body) and a.content_type == 'video/mp4' for a in assets)
+    assert (tmp_path / content_key(assets[0].content_hash)).read_bytes() == body
+    assert len(list(tmp_path.rglob('*'))) == 3  # sha256/<prefix>/<hash>
+
+
+def test_known_urls_are_not_fetched_again(tmp_path):
+    db = make_session()
+    pack = ContentPack(source_id='evt-1', title='t', summary='s')
+    db.add(Asset(content_pack=pack, url='https://cdn.example/a.jpg', type=AssetType.IMAGE, provider='x'))
+    db.commit()
+    store = LocalObjectStore(tmp_path)
+    run_asset_storage(db, store=store, fetcher=FakeFetcher({'https://cdn.example/a.jpg': b'jpeg'}))
+
+    db.add(Asset(content_pack=pack, url='https://cdn.example/a.jpg', type=AssetType.IMAGE, provider='x'))
+    db.add(Asset(content_pack=pack, url='https://cdn.example/missing.jpg', type=AssetType.IMAGE, provider='x'))
+    db.commit()
+    fetcher = FakeFetcher({})
+
+    stats = run_asset_storage(db, store=store, fetcher=fetcher)
+
+    assert fetcher.calls == ['https://cdn.example/missing.jpg']
+    assert stats['reused'] == 1
+    assert stats['failed'] == 1
+
+
+def test_malformed_url_does_not_lose_the_batch(tmp_path):
+    db = make_session()
+    pack = ContentPack(source_id='evt-1', title='t', summary='s')
+    db.add(Asset(content_pack=pack, url='https://cdn.example/good.jpg', type=AssetType.IMAGE, provider='x'))
+    db.add(Asset(content_pack=pack, url='http://cdn.example:notaport/bad.jpg', type=AssetType.IMAGE, provider='x'))
+    db.add(Asset(content_pack=pack, url='not a url', type=AssetType.IMAGE, provider='x'))
+    db.commit()
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=b'jpeg', headers={'content-type': 'image/jpeg'}))
+    fetcher = HttpFetcher(httpx.Client(transport=transport))
+
+    stats = run_asset_storage(db, store=LocalObjectStore(tmp_path), fetcher=fetcher)
+    db.expire_all()
+
+    assert stats['stored'] == 1
+    assert stats['failed'] == 2
+    good = db.query(Asset).filter(Asset.url == 'https://cdn.example/good.jpg').one()
+    assert good.content_type == 'image/jpeg'
+    assert good.local_storage_path is not None
+
+
+def test_concurrent_puts_of_the_same_key_all_succeed(tmp_path):
+    store = LocalObjectStore(tmp_path)
+    errors = []
+
+    def put():
+        try:
+            store.put('sha256/ab/same', io.BytesIO(b'clip' * 1000))
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=put) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert (tmp_path / 'sha256/ab/same').read_bytes() == b'clip' * 1000
+    assert [p.name for p in (tmp_path / 'sha256/ab').iterdir()] == ['same']
+
+
+def test_default_fetcher_client_is_closed(tmp_path, monkeypatch):
+    db = make_session()
+    pack = ContentPack(source_id='evt-1', title='t', summary='s')
+    db.add(Asset(content_pack=pack, url='https://cdn.example/a.jpg', type=AssetType.IMAGE, provider='x'))
+    db.commit()
+    clients = []
+    real_client = httpx.Client
+
+    def make_client(**kwargs):
+        client = real_client(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=b'jpeg')))
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr('app.services.assets.httpx.Client', make_client)
+
+    stats = run_asset_storage(db, store=LocalObjectStore(tmp_path))
+
+    assert stats['stored'] == 1
+    assert [client.is_closed for client in clients] == [True]
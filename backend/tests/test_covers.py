@@ -0,0 +1,137 @@
+import io
+import json
+import multiprocessing
+
+from PIL import Image
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import Asset, ContentPack, ContentPackStatus, CreativeDraft
+from app.services.covers import CANVAS_SIZE, TEMPLATES, RenderJob, jobs_for_draft, render_batch, render_job, run_cover_rendering
+from app.services.storage import LocalObjectStore
+
+
+def make_draft(pack: ContentPack, title: str) -> CreativeDraft:
+    return CreativeDraft(
+        content_pack=pack,
+        generator_name='basic-social-v1',
+        headline_options='[]',
+        cover_spec=json.dumps({'title': title, 'subtitle': 'Location: Zurich', 'style': 'high-contrast, mobile first'}),
+        caption_short='',
+        caption_long='',
+        carousel_outline=json.dumps([{'slide': 1, 'title': 'What happened', 'body': 'Sprint finish.'}]),
+    )
+
+
+def test_render_batch_outputs_images():
+    jobs = [RenderJob('A long title that needs wrapping across several lines of the cover', 'Sub', 'high-contrast')]
+    (body,) = render_batch(jobs, processes=1)
+
+    image = Image.open(io.BytesIO(body))
+    assert image.format == 'PNG'
+    assert image.size == CANVAS_SIZE
+
+
+def test_spec_hash_covers_font_and_template(monkeypatch):
+    job = RenderJob('Title', 'Sub', 'high-contrast')
+    before = job.spec_hash
+
+    monkeypatch.setattr('app.services.covers.settings.cover_font_path', '/fonts/Inter-Bold.ttf')
+    with_font = job.spec_hash
+    assert with_font != before
+
+    monkeypatch.setitem(TEMPLATES['high-contrast'], 'title_size', 96)
+    assert job.spec_hash not in {before, with_font}
+
+
+def test_identical_specs_render_once_and_reruns_skip(tmp_path):
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    for i in range(2):
+        pack = ContentPack(source_id=f'evt-{i}', title='t', summary='s', status=ContentPackStatus.DRAFT_READY)
+        db.add(make_draft(pack, 'Trail runner wins alpine stage'))
+    db.commit()
+    store = LocalObjectStore(tmp_path)
+
+    stats = run_cover_rendering(db, store=store, processes=1)
+
+    assert stats == {'rendered': 2, 'assets_created': 4, 'assets_removed': 0, 'skipped_specs': 0}
+    assets = db.query(Asset).all()
+    assert all(a.content_hash and (tmp_path / a.local_storage_path).exists() for a in assets)
+
+    stats = run_cover_rendering(db, store=store, processes=1)
+    assert stats == {'rendered': 0, 'assets_created': 0, 'assets_removed': 0, 'skipped_specs': 0}
+
+
+def test_render_batch_uses_process_pool_for_large_batches():
+    jobs = [RenderJob(f'Cover {i}', 'Sub', 'default') for i in range(6)]
+
+    assert render_batch(jobs, processes=2) == [render_job(job) for job in jobs]
+
+
+def _render_in_daemon(queue):
+    jobs = [RenderJob(f'Cover {i}', 'Sub', 'default') for i in range(6)]
+    try:
+        queue.put(len(render_batch(jobs, processes=2)))
+    except Exception as exc:
+        queue.put(repr(exc))
+
+
+def test_render_batch_falls_back_in_daemonic_worker():
+    ctx = multiprocessing.get_context('fork')
+    queue = ctx.Queue()
+    worker = ctx.Process(target=_render_in_daemon, args=(queue,), daemon=True)
+    worker.start()
+    result = queue.get(timeout=60)
+    worker.join()
+
+    assert result == 6
+
+
+def test_only_latest_draft_is_rendered_and_stored_objects_are_reused(tmp_path):
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    pack = ContentPack(source_id='evt-1', title='t', summary='s', status=ContentPackStatus.DRAFT_READY)
+    db.add(make_draft(pack, 'Superseded headline'))
+    db.commit()
+    latest = make_draft(pack, 'Latest headline')
+    db.add(latest)
+    db.commit()
+
+    # The cover is already in the store (e.g. from another environment) but has no asset row.
+    store = LocalObjectStore(tmp_path)
+    cover_job = jobs_for_draft(latest)[0]
+    body = render_job(cover_job)
+    store.put(cover_job.key, io.BytesIO(body))
+
+    stats = run_cover_rendering(db, store=store, processes=1)
+
+    assert stats == {'rendered': 1, 'assets_created': 2, 'assets_removed': 0, 'skipped_specs': 1}
+    cover = db.query(Asset).filter(Asset.url == f'spec:{cover_job.spec_hash}').one()
+    assert cover.size_bytes == len(body)
+    assert cover.content_hash is not None
+    assert {a.url for a in db.query(Asset)} == {f'spec:{job.spec_hash}' for job in jobs_for_draft(latest)}
+
+
+def test_regenerated_draft_replaces_stale_covers(tmp_path):
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    pack = ContentPack(source_id='evt-1', title='t', summary='s', status=ContentPackStatus.DRAFT_READY)
+    db.add(make_draft(pack, 'First headline'))
+    db.commit()
+    store = LocalObjectStore(tmp_path)
+    run_cover_rendering(db, store=store, processes=1)
+
+    regenerated = make_draft(pack, 'Regenerated headline')
+    db.add(regenerated)
+    db.commit()
+    stats = run_cover_rendering(db, store=store, processes=1)
+
+    # The carousel slide is unchanged, so only the cover is replaced.
+    assert stats == {'rendered': 1, 'assets_created': 1, 'assets_removed': 1, 'skipped_specs': 0}
+    db.refresh(pack)
+    assert {a.url for a in pack.assets} == {f'spec:{job.spec_hash}' for job in jobs_for_draft(regenerated)}
@@ -0,0 +1,176 @@
+import threading
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import ContentPack, ContentPackStatus, GeneratorRun
+from app.plugins.defaults import BasicSocialGenerator
+from app.plugins.interfaces import EnrichmentResult, IngestedItem
+from app.plugins.registry import GeneratorRegistration
+from app.services.fanout import GeneratorFanOut
+from app.services.pipeline import (
+    failed_attempts,
+    generator_latency_percentiles,
+    packs_missing_drafts,
+    run_enrichment_and_generation,
+    run_ingestion,
+)
+
+
+class SlowGenerator(BasicSocialGenerator):
+    name = 'slow-v1'
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def generate(self, item, enrichment):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return super().generate(item, enrichment)
+
+
+def test_slow_generator_times_out_without_blocking_others():
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    run_ingestion(db)
+    generators = [
+        GeneratorRegistration(BasicSocialGenerator(), timeout_seconds=5, max_concurrency=2),
+        GeneratorRegistration(SlowGenerator(delay=2), timeout_seconds=0.1, max_concurrency=1),
+    ]
+
+    start = time.monotonic()
+    stats = run_enrichment_and_generation(db, generators=generators)
+
+    assert time.monotonic() - start < 1.5
+    assert stats['generated'] == 2
+    assert stats['generate_failed'] == 1
+    assert stats['generate_cancelled'] == 1
+    assert stats['generators']['basic-social-v1']['count'] == 2
+    for pack in db.query(ContentPack).all():
+        assert [d.generator_name for d in pack.drafts] == ['basic-social-v1']
+        assert pack.status == ContentPackStatus.DRAFT_READY
+
+
+def test_fan_out_respects_concurrency_limit():
+    generator = SlowGenerator(delay=0.05)
+    enrichment = EnrichmentResult(['sport'], {}, None, None, {}, '', False)
+    items = {i: (IngestedItem(f'evt-{i}', 't', 's', None), enrichment, ['slow-v1']) for i in range(6)}
+
+    outcomes = GeneratorFanOut([GeneratorRegistration(generator, timeout_seconds=5, max_concurrency=2)]).run(items)
+
+    assert all(o.status == 'ok' for o in outcomes.values())
+    assert generator.peak == 2
+    assert all(o.latency_seconds >= 0.05 for o in outcomes.values())
+
+
+def test_stuck_workers_are_reused_across_runs_not_leaked():
+    generator = SlowGenerator(delay=1)
+    registration = GeneratorRegistration(generator, timeout_seconds=0.1, max_concurrency=1)
+    fan_out = GeneratorFanOut([registration])
+    enrichment = EnrichmentResult(['sport'], {}, None, None, {}, '', False)
+    item = (IngestedItem('evt-1', 't', 's', None), enrichment, ['slow-v1'])
+    threads_before = set(threading.enumerate())
+
+    first = fan_out.run({1: item})
+    start = time.monotonic()
+    second = fan_out.run({2: item, 3: item})
+
+    assert first[1, 'slow-v1'].status == 'timeout'
+    assert {o.status for o in second.values()} == {'cancelled'}
+    assert time.monotonic() - start < 0.5
+    assert len(set(threading.enumerate()) - threads_before) == 1
+    assert generator.peak == 1
+
+    time.sleep(1)
+    assert registration.stuck_workers() == 0
+
+
+class FlakyGenerator(BasicSocialGenerator):
+    name = 'flaky-v1'
+
+    def __init__(self):
+        self.broken = True
+
+    def generate(self, item, enrichment):
+        if self.broken:
+            raise RuntimeError('model unavailable')
+        return super().generate(item, enrichment)
+
+
+def test_failed_generator_is_recorded_and_retried_later(monkeypatch):
+    monkeypatch.setattr('app.services.pipeline.settings.generator_max_attempts', 2)
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    run_ingestion(db)
+    flaky = FlakyGenerator()
+    generators = [
+        GeneratorRegistration(BasicSocialGenerator(), timeout_seconds=5, max_concurrency=2),
+        GeneratorRegistration(flaky, timeout_seconds=5, max_concurrency=2),
+    ]
+
+    stats = run_enrichment_and_generation(db, generators=generators)
+
+    assert stats['generate_failed'] == 2
+    failures = db.query(GeneratorRun).filter(GeneratorRun.generator_name == 'flaky-v1').all()
+    assert {(r.status, r.error) for r in failures} == {('error', 'model unavailable')}
+    assert all(p.status == ContentPackStatus.DRAFT_READY for p in db.query(ContentPack))
+    assert set(generator_latency_percentiles(db)) == {'basic-social-v1', 'flaky-v1'}
+
+    flaky.broken = False
+    stats = run_enrichment_and_generation(db, generators=generators)
+
+    assert stats['generated'] == 2
+    assert stats['generate_skipped'] == 2
+    for pack in db.query(ContentPack):
+        assert sorted(d.generator_name for d in pack.drafts) == ['basic-social-v1', 'flaky-v1']
+
+
+def test_generator_stops_retrying_after_max_attempts(monkeypatch):
+    monkeypatch.setattr('app.services.pipeline.settings.generator_max_attempts', 2)
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    run_ingestion(db)
+    generators = [
+        GeneratorRegistration(BasicSocialGenerator(), timeout_seconds=5, max_concurrency=2),
+        GeneratorRegistration(FlakyGenerator(), timeout_seconds=5, max_concurrency=2),
+    ]
+
+    for _ in range(3):
+        run_enrichment_and_generation(db, generators=generators)
+
+    assert db.query(GeneratorRun).filter(GeneratorRun.status == 'error').count() == 4
+    assert run_enrichment_and_generation(db, generators=generators)['packs'] == 0
+
+
+def test_cancelled_calls_do_not_use_up_attempts(monkeypatch):
+    monkeypatch.setattr('app.services.pipeline.settings.generator_max_attempts', 1)
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    db.add_all(ContentPack(source_id=f'evt-{i}', title='t', summary='s') for i in range(4))
+    db.commit()
+    generators = [
+        GeneratorRegistration(BasicSocialGenerator(), timeout_seconds=5, max_concurrency=2),
+        GeneratorRegistration(SlowGenerator(delay=1), timeout_seconds=0.1, max_concurrency=1),
+    ]
+
+    stats = run_enrichment_and_generation(db, generators=generators)
+
+    assert stats['generate_failed'] == 1
+    assert stats['generate_cancelled'] == 3
+    packs = db.query(ContentPack).all()
+    (timed_out,) = [p for p in packs if failed_attempts(p, 'slow-v1') == 1]
+    retryable = {p.id for p in packs_missing_drafts(db, ['slow-v1'])}
+    assert retryable == {p.id for p in packs} - {timed_out.id}
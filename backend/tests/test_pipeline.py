@@ -4,10 +4,10 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.database import Base
-from app.models import ContentPack, ContentPackStatus
+from app.models import ContentPack, ContentPackStatus, CreativeDraft
 from app.plugins.defaults import BasicSocialGenerator
 from app.plugins.interfaces import EnrichmentResult, IngestedItem
-from app.services.pipeline import dedupe_by_source, set_status
+from app.services.pipeline import dedupe_by_source, run_enrichment_and_generation, run_ingestion, set_status
 
 
 def test_dedupe_by_source():
@@ -55,3 +55,43 @@ def test_generator_output_validation():
     json.dumps(draft.headline_options)
     json.dumps(draft.cover_spec)
     json.dumps(draft.carousel_outline)
+
+
+def test_reruns_skip_unchanged_inputs():
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    run_ingestion(db)
+
+    counts = ('packs', 'enriched', 'enrich_skipped', 'generated', 'generate_skipped')
+    stats = run_enrichment_and_generation(db)
+    assert [stats[k] for k in counts] == [2, 2, 0, 2, 0]
+
+    packs = db.query(ContentPack).order_by(ContentPack.id).all()
+    for pack in packs:
+        pack.status = ContentPackStatus.ENRICHED
+    packs[0].summary = 'Edited summary.'
+    db.commit()
+
+    stats = run_enrichment_and_generation(db)
+    assert [stats[k] for k in counts] == [2, 1, 1, 1, 1]
+    assert db.query(CreativeDraft).count() == 3
+
+    for pack in packs:
+        pack.status = ContentPackStatus.ENRICHED
+    db.commit()
+    stats = run_enrichment_and_generation(db, force=True)
+    assert stats['generated'] == 2
+    assert stats['generate_skipped'] == 0
+
+    # A -> B -> A: the latest draft is B's, so reverting to A must regenerate.
+    original_summary = packs[1].summary
+    for summary in ('B summary', original_summary):
+        packs[1].summary = summary
+        packs[1].status = ContentPackStatus.ENRICHED
+        db.commit()
+        stats = run_enrichment_and_generation(db)
+        assert stats['generated'] == 1
+    newest = max(packs[1].drafts, key=lambda d: d.id)
+    assert 'B summary' not in newest.caption_long
+    assert original_summary in newest.caption_long
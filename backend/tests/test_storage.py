@@ -0,0 +1,72 @@
+import io
+
+import boto3
+from botocore.stub import Stubber
+
+from app.services.storage import S3ObjectStore
+
+
+def make_store(**kwargs):
+    client = boto3.client('s3', region_name='us-east-1', aws_access_key_id='k', aws_secret_access_key='s')
+    return S3ObjectStore('assets', client=client, **kwargs), Stubber(client)
+
+
+def test_exists_creates_missing_bucket_and_maps_404_to_false():
+    store, stubber = make_store()
+    stubber.add_client_error('head_bucket', service_error_code='404', http_status_code=404, expected_params={'Bucket': 'assets'})
+    stubber.add_response('create_bucket', {}, {'Bucket': 'assets'})
+    stubber.add_client_error('head_object', service_error_code='404', http_status_code=404, expected_params={'Bucket': 'assets', 'Key': 'sha256/ab/x'})
+    stubber.add_response('head_object', {'ContentLength': 4}, {'Bucket': 'assets', 'Key': 'sha256/ab/y'})
+
+    with stubber:
+        assert store.exists('sha256/ab/x') is False
+        assert store.exists('sha256/ab/y') is True
+    stubber.assert_no_pending_responses()
+
+
+def test_exists_raises_other_client_errors():
+    store, stubber = make_store()
+    stubber.add_response('head_bucket', {}, {'Bucket': 'assets'})
+    stubber.add_client_error('head_object', service_error_code='403', http_status_code=403)
+
+    with stubber:
+        try:
+            store.exists('sha256/ab/x')
+        except Exception as exc:
+            assert exc.response['Error']['Code'] == '403'
+        else:
+            raise AssertionError('expected a ClientError')
+
+
+def test_put_uses_multipart_upload_above_chunk_size():
+    store, stubber = make_store(multipart_chunk_mb=5, upload_concurrency=1)
+    body = b'x' * (5 * 1024 * 1024 + 10)
+    calls = []
+    store.client.meta.events.register_first('before-parameter-build.s3', lambda params, model, **kw: calls.append((model.name, dict(params))))
+    # Checksum parameters vary across botocore releases, so parameters are checked via the event hook instead.
+    stubber.add_response('head_bucket', {}, {'Bucket': 'assets'})
+    stubber.add_response('create_multipart_upload', {'UploadId': 'u1'})
+    stubber.add_response('upload_part', {'ETag': '"e1"'})
+    stubber.add_response('upload_part', {'ETag': '"e2"'})
+    stubber.add_response('complete_multipart_upload', {})
+
+    with stubber:
+        store.put('sha256/ab/big', io.BytesIO(body), 'video/mp4')
+    stubber.assert_no_pending_responses()
+
+    names = [name for name, _ in calls]
+    assert names == ['HeadBucket', 'CreateMultipartUpload', 'UploadPart', 'UploadPart', 'CompleteMultipartUpload']
+    assert calls[1][1]['Key'] == 'sha256/ab/big'
+    assert calls[1][1]['ContentType'] == 'video/mp4'
+
+
+def test_head_reads_size_and_content_hash_metadata():
+    store, stubber = make_store()
+    stubber.add_response('head_bucket', {}, {'Bucket': 'assets'})
+    stubber.add_response('head_object', {'ContentLength': 42, 'Metadata': {'sha256': 'ab' * 32}}, {'Bucket': 'assets', 'Key': 'covers/ab/x.png'})
+
+    with stubber:
+        info = store.head('covers/ab/x.png')
+
+    assert info.size_bytes == 42
+    assert info.content_hash == 'ab' * 32
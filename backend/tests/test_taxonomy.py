@@ -0,0 +1,57 @@
+from app.plugins.defaults import GlobalContextEnricher
+from app.plugins.interfaces import IngestedItem
+from app.plugins.taxonomy import TaxonomyTagger
+
+TAXONOMY = {
+    'sport': {'surfing': ['surf', 'big wave']},
+    'athlete': {'Kelly Slater': ['slater']},
+    'hazard': {'weather warning': ['swell warning']},
+}
+
+
+def test_matches_whole_words_and_aliases():
+    tagger = TaxonomyTagger.from_taxonomy(TAXONOMY)
+
+    tags, why = tagger.tag('Slater rides  BIG   wave', 'Surfboard sales up; swell warning issued.')
+
+    assert tags == ['athlete', 'sport', 'hazard']
+    assert why['athlete'] == "Matched 'slater' (Kelly Slater) in title."
+    assert why['sport'] == "Matched 'big wave' (surfing) in title."  # 'surfboard' is not a whole-word match
+    assert "'swell warning' (weather warning) in summary" in why['hazard']
+
+
+def test_compiled_automaton_is_cached_on_disk(tmp_path):
+    taxonomy_path = tmp_path / 'taxonomy.json'
+    taxonomy_path.write_text('{"athlete": {"runner": ["runners"]}}')
+    cache_dir = tmp_path / 'cache'
+
+    first = TaxonomyTagger.from_file(taxonomy_path, cache_dir)
+    cached = list(cache_dir.glob('taxonomy-*.json'))
+    second = TaxonomyTagger.from_file(taxonomy_path, cache_dir)
+
+    assert len(cached) == 1
+    assert second.version == first.version
+    assert second.tag('Runners collide', '')[0] == ['athlete']
+
+
+def test_enricher_uses_taxonomy_for_tags_and_breaking():
+    enricher = GlobalContextEnricher(TaxonomyTagger.from_taxonomy(TAXONOMY))
+
+    result = enricher.enrich(IngestedItem('evt-1', 'Swell warning halts surf final', 'Slater waits.', 'Sydney'))
+
+    assert result.tags == ['sport', 'hazard', 'athlete', 'location']
+    assert result.breaking is True
+    assert enricher.name.startswith('global-context-v2+')
+
+
+def test_invalid_cache_is_ignored_and_rebuilt(tmp_path):
+    taxonomy_path = tmp_path / 'taxonomy.json'
+    taxonomy_path.write_text('{"athlete": {"runner": ["runners"]}}')
+    cache_dir = tmp_path / 'cache'
+    TaxonomyTagger.from_file(taxonomy_path, cache_dir)
+    (cache_file,) = cache_dir.glob('taxonomy-*.json')
+
+    for content in ('not json', '{"format": 1, "keywords": [], "goto": [{"r": 99}], "fail": [0], "output": [[]]}'):
+        cache_file.write_text(content)
+        tagger = TaxonomyTagger.from_file(taxonomy_path, cache_dir)
+        assert tagger.tag('Runners collide', '')[0] == ['athlete']